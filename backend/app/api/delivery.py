@@ -0,0 +1,178 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Header
+from fastapi.responses import Response
+from pydantic import BaseModel
+from typing import Dict, Any, Sequence
+import json
+import os
+import secrets
+from dotenv import load_dotenv
+from app.core.sessions import (
+    DEFAULT_RECHECK_INTERVAL, DEFAULT_SESSION_TTL, MerchantSession, SessionStore
+)
+from app.providers.base import OrderCreate, ProviderError
+from app.providers.compact import CompactTable
+from app.providers.managed import ManagedProvider
+from app.providers.registry import registry
+
+load_dotenv()
+
+# Every carrier shares these routes, e.g. /api/alwaseet/regions
+router = APIRouter(prefix="/api/{provider}", tags=["delivery"])
+
+# Merchant sessions (session ID -> validated provider token)
+session_store = SessionStore(
+    ttl_seconds=float(os.environ.get("DELIVERY_SESSION_TTL", DEFAULT_SESSION_TTL)),
+    recheck_interval=float(
+        os.environ.get("DELIVERY_SESSION_RECHECK", DEFAULT_RECHECK_INTERVAL)
+    )
+)
+
+
+# Operators read /metrics with X-Admin-Token; the endpoint is off when unset
+METRICS_TOKEN = os.environ.get("DELIVERY_METRICS_TOKEN", "")
+
+
+class SessionCreate(BaseModel):
+    username: str
+    password: str
+
+
+def get_provider(provider: str) -> ManagedProvider:
+    """Look up the adapter for the delivery company in the path"""
+    try:
+        return registry.get(provider)
+    except KeyError:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Unknown delivery provider: {provider}"
+        )
+
+
+async def get_merchant_session(
+    provider: str,
+    session_id: str = Header(..., alias="X-Delivery-Session")
+) -> MerchantSession:
+    """Resolve the merchant session sent with the request"""
+    session = await session_store.resolve(session_id)
+    if session is None or session.provider != provider:
+        raise HTTPException(
+            status_code=401,
+            detail="Delivery session is invalid or has expired"
+        )
+    return session
+
+
+def require_admin(
+    admin_token: str = Header("", alias="X-Admin-Token")
+) -> None:
+    """Guard operator-only endpoints behind DELIVERY_METRICS_TOKEN"""
+    if not METRICS_TOKEN or not secrets.compare_digest(
+        admin_token.encode(), METRICS_TOKEN.encode()
+    ):
+        raise HTTPException(status_code=403, detail="Not allowed")
+
+
+def provider_error(e: ProviderError) -> HTTPException:
+    return HTTPException(status_code=e.status_code, detail=e.detail)
+
+
+def list_response(key: str, rows: Sequence[Dict[str, Any]]) -> Response:
+    """{"success": true, key: rows}, encoded straight from cached compact tables"""
+    if isinstance(rows, CompactTable):
+        body = rows.to_json()
+    else:
+        body = json.dumps(rows, ensure_ascii=False, separators=(",", ":")).encode()
+    return Response(
+        content=b'{"success":true,"' + key.encode() + b'":' + body + b"}",
+        media_type="application/json"
+    )
+
+
+@router.post("/session")
+async def create_session(
+    credentials: SessionCreate,
+    carrier: ManagedProvider = Depends(get_provider)
+) -> Dict[str, Any]:
+    """Validate merchant credentials once and open a session"""
+    try:
+        token = await carrier.login(credentials.username, credentials.password)
+    except ProviderError as e:
+        raise provider_error(e)
+
+    session = await session_store.create(carrier.name, credentials.username, token)
+    return {
+        "success": True,
+        "session_id": session.session_id,
+        "expires_in": int(session_store.ttl_seconds)
+    }
+
+
+@router.delete("/session")
+async def delete_session(
+    session: MerchantSession = Depends(get_merchant_session)
+) -> Dict[str, Any]:
+    """Close a merchant session"""
+    await session_store.revoke(session.session_id)
+    return {"success": True}
+
+
+@router.get("/cities")
+async def get_cities(
+    carrier: ManagedProvider = Depends(get_provider),
+    session: MerchantSession = Depends(get_merchant_session)
+) -> Response:
+    """Get list of cities from the delivery company"""
+    try:
+        cities = await carrier.get_cities(session.token)
+    except ProviderError as e:
+        raise provider_error(e)
+    return list_response("cities", cities)
+
+
+@router.get("/regions")
+async def get_regions(
+    city_id: int = Query(..., description="City ID"),
+    carrier: ManagedProvider = Depends(get_provider),
+    session: MerchantSession = Depends(get_merchant_session)
+) -> Response:
+    """Get list of regions for a specific city from the delivery company"""
+    try:
+        regions = await carrier.get_regions(session.token, city_id)
+    except ProviderError as e:
+        raise provider_error(e)
+    return list_response("regions", regions)
+
+
+@router.get("/package-sizes")
+async def get_package_sizes(
+    carrier: ManagedProvider = Depends(get_provider),
+    session: MerchantSession = Depends(get_merchant_session)
+) -> Response:
+    """Get list of package sizes from the delivery company"""
+    try:
+        sizes = await carrier.get_package_sizes(session.token)
+    except ProviderError as e:
+        raise provider_error(e)
+    return list_response("sizes", sizes)
+
+
+@router.post("/orders")
+async def create_order(
+    order: OrderCreate,
+    carrier: ManagedProvider = Depends(get_provider),
+    session: MerchantSession = Depends(get_merchant_session)
+) -> Dict[str, Any]:
+    """Create a shipment with the delivery company"""
+    try:
+        created = await carrier.create_order(session.token, order)
+    except ProviderError as e:
+        raise provider_error(e)
+    return {"success": True, "order": created}
+
+
+@router.get("/metrics", dependencies=[Depends(require_admin)])
+async def get_metrics(
+    carrier: ManagedProvider = Depends(get_provider)
+) -> Dict[str, Any]:
+    """Cache, retry and latency counters for the provider"""
+    return {"success": True, "metrics": carrier.metrics()}
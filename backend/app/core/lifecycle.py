@@ -0,0 +1,251 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from types import FrameType
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import uvicorn
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for in-flight work before giving up on shutdown
+DEFAULT_DRAIN_TIMEOUT = 20.0
+
+# Seconds a single warm-up may take before startup moves on
+DEFAULT_WARMUP_TIMEOUT = 10.0
+
+
+class Draining(Exception):
+    """Raised when new work is submitted after shutdown has begun"""
+
+
+class ResourceManager:
+    """Owns long-lived resources and the app's startup/shutdown sequence.
+
+    Startup runs warm-ups concurrently and starts background tasks.
+    Draining begins at begin_drain() (called from the SIGTERM handler by
+    DrainingServer, or by shutdown() otherwise): new work is refused and
+    the drain deadline starts. Shutdown waits for in-flight work until that
+    deadline, cancels background tasks and then runs closers in reverse
+    registration order (buffers flush before the clients they write to close).
+    """
+
+    def __init__(
+        self,
+        drain_timeout: float = DEFAULT_DRAIN_TIMEOUT,
+        warmup_timeout: float = DEFAULT_WARMUP_TIMEOUT,
+    ):
+        self.drain_timeout = drain_timeout
+        self.warmup_timeout = warmup_timeout
+        self._warmups: List[Tuple[str, Callable[[], Awaitable[Any]]]] = []
+        self._background: List[Tuple[str, Callable[[], Awaitable[Any]]]] = []
+        self._closers: List[Tuple[str, Callable[[], Any]]] = []
+        self._tasks: List[asyncio.Task] = []
+        self._in_flight = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._accepting = True
+        self._drain_started: Optional[float] = None
+        self._in_flight_at_drain = 0
+        self._abandoned = 0
+        self.last_report: Optional[Dict[str, Any]] = None
+
+    @property
+    def accepting(self) -> bool:
+        return self._accepting
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def add_warmup(self, name: str, fn: Callable[[], Awaitable[Any]]) -> None:
+        self._warmups.append((name, fn))
+
+    def add_background(self, name: str, fn: Callable[[], Awaitable[Any]]) -> None:
+        self._background.append((name, fn))
+
+    def add_closer(self, name: str, fn: Callable[[], Any]) -> None:
+        """Register a sync or async callable run at shutdown"""
+        self._closers.append((name, fn))
+
+    @asynccontextmanager
+    async def track(self):
+        """Count a unit of work so shutdown waits for it"""
+        if not self._accepting:
+            raise Draining()
+        self._in_flight += 1
+        self._idle.clear()
+        try:
+            yield
+        except asyncio.CancelledError:
+            # Cut off by the server's graceful-shutdown timeout
+            if not self._accepting:
+                self._abandoned += 1
+            raise
+        finally:
+            self._in_flight -= 1
+            if self._in_flight == 0:
+                self._idle.set()
+
+    async def _warmup(self, name: str, fn) -> Tuple[str, str]:
+        try:
+            await asyncio.wait_for(fn(), self.warmup_timeout)
+            return name, "ok"
+        except Exception as e:
+            logger.warning("Warm-up %s failed: %r", name, e)
+            return name, f"failed: {e!r}"
+
+    async def startup(self) -> Dict[str, Any]:
+        """Run warm-ups concurrently, then start background tasks"""
+        self._accepting = True
+        self._drain_started = None
+        self._abandoned = 0
+        start = time.perf_counter()
+        results = await asyncio.gather(*(self._warmup(name, fn) for name, fn in self._warmups))
+
+        for name, fn in self._background:
+            self._tasks.append(asyncio.create_task(fn(), name=name))
+
+        report = {
+            "warmup_seconds": round(time.perf_counter() - start, 3),
+            "warmups": dict(results),
+        }
+        logger.info("Startup complete in %.3fs: %s", report["warmup_seconds"], report["warmups"])
+        return report
+
+    def begin_drain(self) -> None:
+        """Stop accepting work and start the drain deadline"""
+        if self._drain_started is not None:
+            return
+        self._accepting = False
+        self._drain_started = time.perf_counter()
+        self._in_flight_at_drain = self._in_flight
+        logger.info("Draining: refusing new work, %d calls in flight", self._in_flight)
+
+    async def shutdown(self) -> Dict[str, Any]:
+        """Drain within the deadline and release resources"""
+        self.begin_drain()
+        remaining = self.drain_timeout - (time.perf_counter() - self._drain_started)
+
+        try:
+            await asyncio.wait_for(self._idle.wait(), max(remaining, 0))
+        except asyncio.TimeoutError:
+            pass
+        drain_seconds = time.perf_counter() - self._drain_started
+        abandoned = self._abandoned + self._in_flight
+        drained = abandoned == 0
+
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        for name, fn in reversed(self._closers):
+            try:
+                result = fn()
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                logger.error("Closing %s failed: %r", name, e)
+
+        report = {
+            "drained": drained,
+            "drain_seconds": round(drain_seconds, 3),
+            "in_flight_at_drain": self._in_flight_at_drain,
+            "abandoned": abandoned,
+        }
+        if drained:
+            logger.info(
+                "Drained %d in-flight calls in %.3fs", self._in_flight_at_drain, drain_seconds
+            )
+        else:
+            logger.warning(
+                "Drain deadline of %.1fs hit with %d calls cut off",
+                self.drain_timeout, abandoned
+            )
+        self.last_report = report
+        return report
+
+    @asynccontextmanager
+    async def lifespan(self, app):
+        """FastAPI lifespan handler"""
+        await self.startup()
+        try:
+            yield
+        finally:
+            await self.shutdown()
+
+
+def every(interval: float, fn: Callable[[], Any]) -> Callable[[], Awaitable[None]]:
+    """Background task running a sync or async callable on an interval"""
+
+    async def loop():
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                result = fn()
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                logger.error("Background task %r failed: %r", fn, e)
+
+    return loop
+
+
+class DrainMiddleware:
+    """Tracks HTTP requests as in-flight work and refuses new ones while draining"""
+
+    def __init__(self, app, manager: ResourceManager):
+        self.app = app
+        self.manager = manager
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            async with self.manager.track():
+                await self.app(scope, receive, send)
+        except Draining:
+            await send({
+                "type": "http.response.start",
+                "status": 503,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"connection", b"close"),
+                    (b"retry-after", b"1"),
+                ],
+            })
+            await send({
+                "type": "http.response.body",
+                "body": b'{"detail":"Server is shutting down"}',
+            })
+
+
+class DrainingServer(uvicorn.Server):
+    """uvicorn server that starts the manager's drain as soon as SIGTERM/SIGINT arrives.
+
+    Plain uvicorn closes its sockets and waits for open connections before
+    sending the lifespan shutdown event, so draining from the lifespan alone
+    would start only after the requests it should bound have finished.
+    """
+
+    def __init__(self, config: uvicorn.Config, manager: ResourceManager):
+        super().__init__(config)
+        self.manager = manager
+
+    def handle_exit(self, sig: int, frame: Optional[FrameType]) -> None:
+        self.manager.begin_drain()
+        super().handle_exit(sig, frame)
+
+
+def build_server(app, manager: ResourceManager, **config) -> DrainingServer:
+    """DrainingServer whose graceful-shutdown wait uses the manager's deadline"""
+    config.setdefault("timeout_graceful_shutdown", manager.drain_timeout)
+    return DrainingServer(uvicorn.Config(app, **config), manager)
+
+
+def serve(app, manager: ResourceManager, **config) -> None:
+    build_server(app, manager, **config).run()
@@ -0,0 +1,160 @@
+import hashlib
+import secrets
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional, Protocol
+
+
+# Default lifetime of a merchant session (seconds)
+DEFAULT_SESSION_TTL = 12 * 60 * 60
+
+# Seconds a worker trusts its local copy before re-checking the shared store,
+# which bounds how long a session revoked on another worker stays usable
+DEFAULT_RECHECK_INTERVAL = 30.0
+
+
+class MerchantSession:
+    """A validated merchant login, resolved from an opaque session ID"""
+
+    __slots__ = ("session_id", "provider", "username", "token", "expires_at", "recheck_at")
+
+    def __init__(
+        self, session_id: str, provider: str, username: str, token: str, expires_at: float,
+        recheck_at: float = float("inf"),
+    ):
+        self.session_id = session_id
+        self.provider = provider
+        self.username = username
+        self.token = token
+        self.expires_at = expires_at
+        self.recheck_at = recheck_at
+
+
+class SharedSessionBackend(Protocol):
+    """Store shared between workers (e.g. MongoDB) used behind the local map"""
+
+    async def load(self, session_id: str) -> Optional[Dict[str, Any]]: ...
+
+    async def save(self, session_id: str, record: Dict[str, Any]) -> None: ...
+
+    async def delete(self, session_id: str) -> None: ...
+
+
+class MongoSessionBackend:
+    """Shared session backend on top of a Motor collection.
+
+    Documents are keyed by a SHA-256 digest of the session ID, so a read of
+    the collection does not yield IDs that can be replayed as headers.
+    """
+
+    def __init__(self, collection):
+        self.collection = collection
+
+    @staticmethod
+    def _key(session_id: str) -> str:
+        return hashlib.sha256(session_id.encode()).hexdigest()
+
+    async def load(self, session_id: str) -> Optional[Dict[str, Any]]:
+        return await self.collection.find_one({"_id": self._key(session_id)})
+
+    async def save(self, session_id: str, record: Dict[str, Any]) -> None:
+        document = dict(record)
+        # Native datetime so a Mongo TTL index can expire the document
+        document["expires_on"] = datetime.fromtimestamp(record["expires_at"], tz=timezone.utc)
+        await self.collection.replace_one({"_id": self._key(session_id)}, document, upsert=True)
+
+    async def delete(self, session_id: str) -> None:
+        await self.collection.delete_one({"_id": self._key(session_id)})
+
+
+class SessionStore:
+    """In-memory session map with TTL and an optional shared backend.
+
+    Resolving a session is a single dict lookup; the shared backend is only
+    consulted when the ID is unknown to this worker or its local copy is
+    older than recheck_interval, so revocations reach every worker.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_SESSION_TTL,
+        shared: Optional[SharedSessionBackend] = None,
+        clock: Callable[[], float] = time.time,
+        recheck_interval: float = DEFAULT_RECHECK_INTERVAL,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.shared = shared
+        self.clock = clock
+        self.recheck_interval = recheck_interval
+        self._sessions: Dict[str, MerchantSession] = {}
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    async def create(self, provider: str, username: str, token: str) -> MerchantSession:
+        """Register a validated login and return its new session"""
+        session = MerchantSession(
+            session_id=secrets.token_urlsafe(24),
+            provider=provider,
+            username=username,
+            token=token,
+            expires_at=self.clock() + self.ttl_seconds,
+        )
+        self._sessions[session.session_id] = session
+
+        if self.shared is not None:
+            session.recheck_at = self.clock() + self.recheck_interval
+            await self.shared.save(session.session_id, {
+                "provider": session.provider,
+                "username": session.username,
+                "token": session.token,
+                "expires_at": session.expires_at,
+            })
+        return session
+
+    async def resolve(self, session_id: str) -> Optional[MerchantSession]:
+        """Return the live session for an ID, or None if unknown or expired"""
+        now = self.clock()
+        session = self._sessions.get(session_id)
+        if session is not None:
+            if session.expires_at <= now:
+                del self._sessions[session_id]
+                return None
+            if session.recheck_at > now:
+                return session
+
+        if self.shared is None:
+            return None
+
+        record = await self.shared.load(session_id)
+        if not record or record["expires_at"] <= now:
+            self._sessions.pop(session_id, None)
+            return None
+
+        session = MerchantSession(
+            session_id=session_id,
+            provider=record["provider"],
+            username=record["username"],
+            token=record["token"],
+            expires_at=record["expires_at"],
+            recheck_at=now + self.recheck_interval,
+        )
+        self._sessions[session_id] = session
+        return session
+
+    async def revoke(self, session_id: str) -> None:
+        """Forget a session locally and in the shared backend"""
+        self._sessions.pop(session_id, None)
+        if self.shared is not None:
+            await self.shared.delete(session_id)
+
+    def sweep(self) -> int:
+        """Drop expired local entries, returning how many were removed.
+
+        Run periodically from a background task rather than on the request path.
+        """
+        now = self.clock()
+        expired = [sid for sid, s in self._sessions.items() if s.expires_at <= now]
+        for sid in expired:
+            del self._sessions[sid]
+        return len(expired)
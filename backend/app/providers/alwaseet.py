@@ -0,0 +1,106 @@
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from app.providers.base import (
+    DeliveryProvider,
+    OrderCreate,
+    ProviderAuthError,
+    ProviderError,
+    ProviderUnavailable,
+)
+
+
+# Alwaseet API Configuration
+ALWASEET_BASE_URL = "https://api.alwaseet-iq.net/v1/merchant"
+
+
+class AlwaseetProvider(DeliveryProvider):
+    """Alwaseet merchant API (responses wrapped in status/data/msg)"""
+
+    name = "alwaseet"
+
+    def __init__(
+        self,
+        base_url: str = ALWASEET_BASE_URL,
+        timeout: float = 10.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self._client = httpx.AsyncClient(base_url=base_url, timeout=timeout, transport=transport)
+
+    async def _request(self, method: str, path: str, action: str, **kwargs) -> Any:
+        try:
+            response = await self._client.request(method, path, **kwargs)
+            response.raise_for_status()
+            data = response.json()
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code >= 500:
+                raise ProviderUnavailable(f"Error {action}: {str(e)}")
+            raise ProviderError(f"Error {action}: {str(e)}", status_code=500)
+        except (httpx.HTTPError, ValueError) as e:
+            raise ProviderUnavailable(f"Error {action}: {str(e)}")
+
+        if not isinstance(data, dict):
+            raise ProviderUnavailable(f"Error {action}: unexpected response body")
+        if not data.get("status"):
+            raise ProviderError(data.get("msg", f"Failed {action}"))
+        return data.get("data", [])
+
+    async def login(self, username: str, password: str) -> str:
+        try:
+            data = await self._request(
+                "POST", "/login", "connecting to Alwaseet API",
+                data={"username": username, "password": password},
+            )
+        except ProviderError as e:
+            # Only an explicit rejection in the envelope means bad credentials
+            if e.status_code != 400:
+                raise
+            raise ProviderAuthError(f"Failed to authenticate with Alwaseet: {e.detail}")
+
+        token = data.get("token") if isinstance(data, dict) else None
+        if not token:
+            raise ProviderAuthError("Failed to authenticate with Alwaseet: Unknown error")
+        return token
+
+    async def get_cities(self, token: str) -> List[Dict[str, Any]]:
+        return await self._request("GET", "/citys", "fetching cities", params={"token": token})
+
+    async def get_regions(self, token: str, city_id: int) -> List[Dict[str, Any]]:
+        return await self._request(
+            "GET", "/regions", "fetching regions",
+            params={"token": token, "city_id": city_id},
+        )
+
+    async def get_package_sizes(self, token: str) -> List[Dict[str, Any]]:
+        return await self._request(
+            "GET", "/package-sizes", "fetching package sizes", params={"token": token}
+        )
+
+    async def create_order(self, token: str, order: OrderCreate) -> Dict[str, Any]:
+        form = {
+            "client_name": order.customer_name,
+            "client_mobile": order.phone1,
+            "client_mobile2": order.phone2 or "",
+            "city_id": order.city_id,
+            "region_id": order.region_id,
+            "location": order.address,
+            "type_name": order.type_name,
+            "items_number": order.items_number,
+            "price": order.price,
+            "package_size": order.package_size,
+            "merchant_notes": order.notes or "",
+            "replacement": int(order.replacement),
+        }
+        data = await self._request(
+            "POST", "/create-order", "creating order", params={"token": token}, data=form
+        )
+        # The envelope wraps the new order in a one-element list
+        if isinstance(data, list):
+            if not data:
+                raise ProviderUnavailable("Error creating order: no order in response")
+            data = data[0]
+        return data
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
@@ -0,0 +1,78 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+
+class ProviderError(Exception):
+    """Delivery provider rejected a request or could not be reached"""
+
+    def __init__(self, detail: str, status_code: int = 400, retryable: bool = False):
+        super().__init__(detail)
+        self.detail = detail
+        self.status_code = status_code
+        self.retryable = retryable
+
+
+class ProviderAuthError(ProviderError):
+    """Merchant credentials were refused by the provider"""
+
+    def __init__(self, detail: str):
+        super().__init__(detail, status_code=401)
+
+
+class ProviderUnavailable(ProviderError):
+    """Transport failure or upstream 5xx; safe to retry for reads"""
+
+    def __init__(self, detail: str, status_code: int = 500):
+        super().__init__(detail, status_code=status_code, retryable=True)
+
+
+class OrderCreate(BaseModel):
+    """Carrier-neutral order; each adapter maps it to its own fields"""
+
+    customer_name: str
+    phone1: str
+    phone2: Optional[str] = None
+    city_id: str
+    region_id: str
+    address: str
+    package_size: str
+    type_name: str
+    items_number: int = 1
+    price: int
+    notes: Optional[str] = None
+    replacement: bool = False
+
+
+class DeliveryProvider(ABC):
+    """Async adapter for one delivery company's merchant API.
+
+    Adapters return plain lists/dicts with the carrier envelope already
+    stripped and raise ProviderError subclasses on failure.
+    """
+
+    name: str
+
+    @abstractmethod
+    async def login(self, username: str, password: str) -> str:
+        """Validate merchant credentials and return an API token"""
+
+    @abstractmethod
+    async def get_cities(self, token: str) -> List[Dict[str, Any]]:
+        """List cities served by the carrier"""
+
+    @abstractmethod
+    async def get_regions(self, token: str, city_id: int) -> List[Dict[str, Any]]:
+        """List regions of a city"""
+
+    @abstractmethod
+    async def get_package_sizes(self, token: str) -> List[Dict[str, Any]]:
+        """List package sizes accepted by the carrier"""
+
+    @abstractmethod
+    async def create_order(self, token: str, order: OrderCreate) -> Dict[str, Any]:
+        """Create a shipment and return the carrier's order record"""
+
+    async def aclose(self) -> None:
+        """Release network resources held by the adapter"""
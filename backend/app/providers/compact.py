@@ -0,0 +1,133 @@
+import hashlib
+import json
+import sys
+import weakref
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+def _encode(value: Any) -> str:
+    # Same JSON flavour Starlette's JSONResponse emits
+    return json.dumps(value, ensure_ascii=False, allow_nan=False, separators=(",", ":"))
+
+
+class CompactTable:
+    """Immutable column-oriented copy of a list of flat JSON objects.
+
+    Each column holds the JSON-encoded value of every row as an interned
+    string (None where a row lacks the key), so repeated values across
+    rows and tables share one object and the response body is produced by
+    joining strings without rebuilding dicts. Behaves as a read-only
+    sequence of dicts for callers that need the decoded rows.
+    """
+
+    __slots__ = ("columns", "digest", "_keys", "_values", "_length", "__weakref__")
+
+    def __init__(self, columns: Tuple[str, ...], values: Tuple[Tuple[Optional[str], ...], ...],
+                 length: int, digest: bytes):
+        self.columns = columns
+        self.digest = digest
+        self._keys = tuple(sys.intern(_encode(c) + ":") for c in columns)
+        self._values = values
+        self._length = length
+
+    @classmethod
+    def build(cls, rows: List[Dict[str, Any]], digest: bytes) -> "CompactTable":
+        columns: Dict[str, None] = {}
+        for row in rows:
+            for key in row:
+                if key not in columns:
+                    columns[key] = None
+
+        values = tuple(
+            tuple(sys.intern(_encode(row[c])) if c in row else None for row in rows)
+            for c in columns
+        )
+        return cls(tuple(sys.intern(c) for c in columns), values, len(rows), digest)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _row(self, index: int) -> Dict[str, Any]:
+        return {
+            column: json.loads(values[index])
+            for column, values in zip(self.columns, self._values)
+            if values[index] is not None
+        }
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("CompactTable index out of range")
+        return self._row(index)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for index in range(self._length):
+            yield self._row(index)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, CompactTable):
+            return self.digest == other.digest
+        if isinstance(other, list):
+            return self.to_list() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"<CompactTable rows={self._length} columns={self.columns}>"
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        return list(self)
+
+    def to_json(self) -> bytes:
+        """Encode as a JSON array straight from the stored fragments"""
+        keys = self._keys
+        if not keys:
+            return ("[" + ",".join("{}" for _ in range(self._length)) + "]").encode()
+
+        rows = zip(*self._values)
+        if all(None not in values for values in self._values):
+            # Every row has every key: one %-format per row
+            template = "{" + ",".join(k.replace("%", "%%") + "%s" for k in keys) + "}"
+            objects = [template % row for row in rows]
+        else:
+            objects = [
+                "{" + ",".join(k + v for k, v in zip(keys, row) if v is not None) + "}"
+                for row in rows
+            ]
+        return ("[" + ",".join(objects) + "]").encode()
+
+
+class CompactPool:
+    """Content-addressed pool of CompactTables.
+
+    Identical payloads (e.g. the same city's regions fetched by many
+    merchants) resolve to one shared table. Tables are held weakly and
+    disappear once no cache entry refers to them.
+    """
+
+    def __init__(self):
+        self._tables: "weakref.WeakValueDictionary[bytes, CompactTable]" = weakref.WeakValueDictionary()
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def intern(self, rows: Any) -> Any:
+        """Return the shared CompactTable for rows, or rows unchanged if not tabular"""
+        if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+            return rows
+
+        canonical = json.dumps(rows, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+        digest = hashlib.blake2b(canonical.encode(), digest_size=16).digest()
+        table = self._tables.get(digest)
+        if table is None:
+            table = CompactTable.build(rows, digest)
+            self._tables[digest] = table
+        return table
+
+
+# Pool shared by every provider so equal payloads are stored once per worker
+shared_pool = CompactPool()
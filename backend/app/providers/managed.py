@@ -0,0 +1,205 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Sequence, Tuple
+
+from app.providers.base import DeliveryProvider, OrderCreate, ProviderError, ProviderUnavailable
+from app.providers.compact import CompactPool, shared_pool
+
+
+# Reference data (cities, regions, sizes) changes rarely
+DEFAULT_CACHE_TTL = 15 * 60
+
+# Cache keys include the session token, so bound them (least recently used go first)
+DEFAULT_CACHE_SIZE = 10_000
+
+
+class OperationStats:
+    """Counters for one provider operation"""
+
+    __slots__ = ("calls", "errors", "cache_hits", "coalesced", "retries", "total_seconds")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.cache_hits = 0
+        self.coalesced = 0
+        self.retries = 0
+        self.total_seconds = 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        upstream = self.calls - self.cache_hits - self.coalesced
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "cache_hits": self.cache_hits,
+            "coalesced": self.coalesced,
+            "retries": self.retries,
+            "avg_upstream_ms": round(self.total_seconds / upstream * 1000, 3) if upstream else 0.0,
+        }
+
+
+class ManagedProvider:
+    """Cache, retry, circuit-breaker and metrics layer around a DeliveryProvider.
+
+    Reads are cached per token with a TTL and concurrent misses for the same
+    key share one upstream call, which runs in its own task so cancelling
+    one caller does not cancel the others. Expired entries are dropped on
+    lookup and by sweep(), and the cache is capped at max_entries. Cached
+    lists are stored as CompactTables from a content-addressed pool, so
+    merchants receiving identical payloads share one copy. Retries only
+    apply to idempotent reads; create_order is sent exactly once.
+    """
+
+    def __init__(
+        self,
+        provider: DeliveryProvider,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        max_entries: int = DEFAULT_CACHE_SIZE,
+        retries: int = 2,
+        backoff: float = 0.2,
+        failure_threshold: int = 5,
+        reset_after: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+        pool: Optional[CompactPool] = shared_pool,
+    ):
+        self.provider = provider
+        self.name = provider.name
+        self.cache_ttl = cache_ttl
+        self.max_entries = max_entries
+        self.retries = retries
+        self.backoff = backoff
+        self.failure_threshold = failure_threshold
+        self.reset_after = reset_after
+        self.clock = clock
+        self.pool = pool
+
+        self._cache: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._failures = 0
+        self._open_until = 0.0
+        self._stats: Dict[str, OperationStats] = {}
+
+    def _op_stats(self, operation: str) -> OperationStats:
+        stats = self._stats.get(operation)
+        if stats is None:
+            stats = self._stats[operation] = OperationStats()
+        return stats
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "provider": self.name,
+            "circuit_open": self._open_until > self.clock(),
+            "cache_entries": len(self._cache),
+            "compact_tables": len(self.pool) if self.pool is not None else 0,
+            "operations": {op: stats.snapshot() for op, stats in self._stats.items()},
+        }
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+
+    def sweep(self) -> int:
+        """Drop expired cache entries, returning how many were removed"""
+        now = self.clock()
+        expired = [key for key, (expires_at, _) in self._cache.items() if expires_at <= now]
+        for key in expired:
+            del self._cache[key]
+        return len(expired)
+
+    async def _call(
+        self, operation: str, fn: Callable[..., Awaitable[Any]], *args, retry: bool = True
+    ) -> Any:
+        stats = self._op_stats(operation)
+        if self._open_until > self.clock():
+            stats.errors += 1
+            raise ProviderUnavailable(
+                f"{self.name} is temporarily unavailable", status_code=503
+            )
+
+        attempts = self.retries + 1 if retry else 1
+        start = time.perf_counter()
+        try:
+            for attempt in range(attempts):
+                try:
+                    result = await fn(*args)
+                except ProviderError as e:
+                    if not e.retryable or attempt == attempts - 1:
+                        raise
+                    stats.retries += 1
+                    await asyncio.sleep(self.backoff * (2 ** attempt))
+                else:
+                    self._failures = 0
+                    return result
+        except ProviderError as e:
+            stats.errors += 1
+            if e.retryable:
+                self._failures += 1
+                if self._failures >= self.failure_threshold:
+                    self._open_until = self.clock() + self.reset_after
+            raise
+        finally:
+            stats.total_seconds += time.perf_counter() - start
+
+    async def _cached(self, operation: str, key: Hashable, fn, *args) -> Any:
+        stats = self._op_stats(operation)
+        stats.calls += 1
+
+        entry = self._cache.get(key)
+        if entry is not None:
+            if entry[0] > self.clock():
+                self._cache.move_to_end(key)
+                stats.cache_hits += 1
+                return entry[1]
+            del self._cache[key]
+
+        task = self._inflight.get(key)
+        if task is not None:
+            stats.coalesced += 1
+        else:
+            task = asyncio.create_task(self._fetch(operation, key, fn, *args))
+            # Retrieve the outcome even if every caller was cancelled meanwhile
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._inflight[key] = task
+        return await asyncio.shield(task)
+
+    async def _fetch(self, operation: str, key: Hashable, fn, *args) -> Any:
+        try:
+            result = await self._call(operation, fn, *args)
+            if self.pool is not None:
+                result = self.pool.intern(result)
+            if self.cache_ttl > 0:
+                self._cache[key] = (self.clock() + self.cache_ttl, result)
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.max_entries:
+                    self._cache.popitem(last=False)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    async def login(self, username: str, password: str) -> str:
+        self._op_stats("login").calls += 1
+        return await self._call("login", self.provider.login, username, password)
+
+    async def get_cities(self, token: str) -> Sequence[Dict[str, Any]]:
+        return await self._cached("cities", ("cities", token), self.provider.get_cities, token)
+
+    async def get_regions(self, token: str, city_id: int) -> Sequence[Dict[str, Any]]:
+        return await self._cached(
+            "regions", ("regions", token, city_id), self.provider.get_regions, token, city_id
+        )
+
+    async def get_package_sizes(self, token: str) -> Sequence[Dict[str, Any]]:
+        return await self._cached(
+            "package_sizes", ("package_sizes", token), self.provider.get_package_sizes, token
+        )
+
+    async def create_order(self, token: str, order: OrderCreate) -> Dict[str, Any]:
+        self._op_stats("create_order").calls += 1
+        return await self._call("create_order", self.provider.create_order, token, order, retry=False)
+
+    async def aclose(self) -> None:
+        tasks = list(self._inflight.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self.provider.aclose()
@@ -0,0 +1,59 @@
+from typing import Any, Callable, Dict, List
+
+from app.providers.alwaseet import AlwaseetProvider
+from app.providers.base import DeliveryProvider
+from app.providers.managed import ManagedProvider
+
+
+class ProviderRegistry:
+    """Maps a delivery company's provider name to its managed adapter.
+
+    Adapters are built lazily on first use so unused carriers never open
+    HTTP clients.
+    """
+
+    def __init__(self):
+        self._factories: Dict[str, Callable[[], DeliveryProvider]] = {}
+        self._options: Dict[str, Dict[str, Any]] = {}
+        self._providers: Dict[str, ManagedProvider] = {}
+
+    def register(self, name: str, factory: Callable[[], DeliveryProvider], **options) -> None:
+        """Register an adapter factory; options go to ManagedProvider.
+
+        A name can be re-registered until its adapter is built; after that
+        the live adapter (and its HTTP client) would be orphaned, so it's refused.
+        """
+        if name in self._providers:
+            raise ValueError(f"Provider {name!r} is already in use")
+        self._factories[name] = factory
+        self._options[name] = options
+
+    def names(self) -> List[str]:
+        return list(self._factories)
+
+    def get(self, name: str) -> ManagedProvider:
+        provider = self._providers.get(name)
+        if provider is None:
+            if name not in self._factories:
+                raise KeyError(name)
+            provider = ManagedProvider(self._factories[name](), **self._options[name])
+            self._providers[name] = provider
+        return provider
+
+    def active(self) -> List[ManagedProvider]:
+        return list(self._providers.values())
+
+    def sweep(self) -> int:
+        """Drop expired cache entries from every built adapter"""
+        return sum(provider.sweep() for provider in self._providers.values())
+
+    async def aclose(self) -> None:
+        """Close every adapter that has been built"""
+        providers, self._providers = self._providers, {}
+        for provider in providers.values():
+            await provider.aclose()
+
+
+# Default registry used by the API
+registry = ProviderRegistry()
+registry.register(AlwaseetProvider.name, AlwaseetProvider)
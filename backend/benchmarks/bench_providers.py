@@ -0,0 +1,89 @@
+"""Per-provider benchmark against local fake upstreams.
+
+Run from backend/:  python -m benchmarks.bench_providers --requests 2000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Dict, List
+
+from app.providers.base import OrderCreate
+from app.providers.managed import ManagedProvider
+from benchmarks.fakes import FAKE_PROVIDERS
+
+
+SAMPLE_ORDER = OrderCreate(
+    customer_name="Bench",
+    phone1="+9647700000000",
+    city_id="1",
+    region_id="10001",
+    address="Near the market",
+    package_size="1",
+    type_name="Bench item",
+    price=25000,
+)
+
+
+async def run_operation(provider: ManagedProvider, operation: str, token: str, requests: int,
+                        concurrency: int) -> Dict[str, float]:
+    calls = {
+        "cities": lambda i: provider.get_cities(token),
+        "regions": lambda i: provider.get_regions(token, i % 18 + 1),
+        "package_sizes": lambda i: provider.get_package_sizes(token),
+        "create_order": lambda i: provider.create_order(token, SAMPLE_ORDER),
+    }[operation]
+    latencies: List[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int):
+        async with semaphore:
+            start = time.perf_counter()
+            await calls(i)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "ops_per_sec": requests / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+
+async def bench_provider(name: str, args) -> None:
+    for label, cache_ttl in (("uncached", 0), ("cached", 900)):
+        provider = ManagedProvider(
+            FAKE_PROVIDERS[name](latency=args.latency_ms / 1000), cache_ttl=cache_ttl
+        )
+        try:
+            token = await provider.login("bench", "secret")
+            for operation in ("cities", "regions", "package_sizes", "create_order"):
+                if operation == "create_order" and label == "cached":
+                    continue
+                result = await run_operation(provider, operation, token, args.requests, args.concurrency)
+                print(
+                    f"{name:<10} {label:<9} {operation:<14} "
+                    f"{result['ops_per_sec']:>10.0f} ops/s  "
+                    f"p50 {result['p50_ms']:>7.3f} ms  p95 {result['p95_ms']:>7.3f} ms"
+                )
+        finally:
+            await provider.aclose()
+
+
+async def main(args) -> None:
+    for name in args.providers or list(FAKE_PROVIDERS):
+        await bench_provider(name, args)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="Simulated upstream latency")
+    parser.add_argument("providers", nargs="*", help="Provider names (default: all)")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,106 @@
+"""RSS of cached city/region data: plain dicts vs compact tables.
+
+Fills one provider cache the way a worker would after many merchants
+browse every city, once per mode in a fresh subprocess.
+
+Run from backend/:  python -m benchmarks.bench_region_memory --merchants 50
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+from app.providers.compact import CompactPool
+from app.providers.managed import ManagedProvider
+from benchmarks.fakes import FAKE_PROVIDERS
+
+# Alwaseet serves all 18 Iraqi governorates
+IRAQI_CITIES = 18
+
+
+def rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # Peak RSS; KiB on Linux, bytes on macOS
+        scale = 1 if sys.platform == "darwin" else 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+async def fill_cache(mode: str, merchants: int, regions_per_city: int) -> dict:
+    provider = ManagedProvider(
+        FAKE_PROVIDERS["alwaseet"](cities=IRAQI_CITIES, regions_per_city=regions_per_city),
+        pool=CompactPool() if mode == "compact" else None,
+    )
+    tokens = [await provider.login(f"merchant{i}", "secret") for i in range(merchants)]
+    gc.collect()
+    before = rss_bytes()
+
+    start = time.perf_counter()
+    for token in tokens:
+        for city in await provider.get_cities(token):
+            await provider.get_regions(token, int(city["id"]))
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    after = rss_bytes()
+
+    # Time building the regions response for a warm cache hit
+    regions = await provider.get_regions(tokens[0], 1)
+    start = time.perf_counter()
+    for _ in range(200):
+        if mode == "compact":
+            regions.to_json()
+        else:
+            json.dumps(regions, ensure_ascii=False, separators=(",", ":")).encode()
+    encode_us = (time.perf_counter() - start) / 200 * 1e6
+
+    await provider.aclose()
+    return {
+        "mode": mode,
+        "rss_delta_mb": (after - before) / 2**20,
+        "fill_seconds": elapsed,
+        "encode_us": encode_us,
+        "cached_regions": merchants * IRAQI_CITIES * regions_per_city,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--merchants", type=int, default=50)
+    parser.add_argument("--regions-per-city", type=int, default=1000)
+    parser.add_argument("--mode", choices=["dict", "compact"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(asyncio.run(fill_cache(args.mode, args.merchants, args.regions_per_city))))
+        return
+
+    results = []
+    for mode in ("dict", "compact"):
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_region_memory", "--mode", mode,
+             "--merchants", str(args.merchants), "--regions-per-city", str(args.regions_per_city)],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        results.append(json.loads(output))
+
+    print(f"{args.merchants} merchants x {IRAQI_CITIES} cities x {args.regions_per_city} regions")
+    for r in results:
+        print(
+            f"{r['mode']:<8} RSS +{r['rss_delta_mb']:>8.1f} MB  "
+            f"fill {r['fill_seconds']:>6.2f} s  encode {r['encode_us']:>8.1f} us/response"
+        )
+    saved = results[0]["rss_delta_mb"] / max(results[1]["rss_delta_mb"], 0.1)
+    print(f"compact uses {saved:.1f}x less memory")
+
+
+if __name__ == "__main__":
+    main()
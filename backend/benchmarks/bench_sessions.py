@@ -0,0 +1,70 @@
+"""Overhead of resolving X-Delivery-Session per request.
+
+Times SessionStore.resolve on its own and a full ASGI request through the
+get_merchant_session dependency, against the same route without it.
+
+Run from backend/:  python -m benchmarks.bench_sessions --sessions 5000
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+from fastapi import Depends, FastAPI
+
+from app.api import delivery
+from app.core.sessions import MerchantSession, SessionStore
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/{provider}/open")
+    async def open_route(provider: str):
+        return {"success": True}
+
+    @app.get("/api/{provider}/guarded")
+    async def guarded_route(session: MerchantSession = Depends(delivery.get_merchant_session)):
+        return {"success": True}
+
+    return app
+
+
+async def time_requests(client: httpx.AsyncClient, path: str, ids, requests: int) -> float:
+    start = time.perf_counter()
+    for i in range(requests):
+        response = await client.get(path, headers={"X-Delivery-Session": ids[i % len(ids)]})
+        assert response.status_code == 200, response.text
+    return (time.perf_counter() - start) / requests * 1e6
+
+
+async def main(args) -> None:
+    delivery.session_store = store = SessionStore(ttl_seconds=3600)
+    ids = [(await store.create("fake", f"shop{i}", f"token{i}")).session_id
+           for i in range(args.sessions)]
+
+    start = time.perf_counter()
+    for i in range(args.lookups):
+        await store.resolve(ids[i % len(ids)])
+    resolve_us = (time.perf_counter() - start) / args.lookups * 1e6
+
+    transport = httpx.ASGITransport(app=build_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await time_requests(client, "/api/fake/guarded", ids, 100)
+        open_us = await time_requests(client, "/api/fake/open", ids, args.requests)
+        guarded_us = await time_requests(client, "/api/fake/guarded", ids, args.requests)
+
+    print(f"{args.sessions} live sessions")
+    print(f"SessionStore.resolve      {resolve_us:>8.2f} us/op")
+    print(f"request without session   {open_us:>8.1f} us/op")
+    print(f"request with session      {guarded_us:>8.1f} us/op")
+    print(f"session overhead          {guarded_us - open_us:>8.1f} us/request")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=5000)
+    parser.add_argument("--lookups", type=int, default=200_000)
+    parser.add_argument("--requests", type=int, default=2000)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,62 @@
+"""Local fake carrier upstreams for benchmarks and tests"""
+
+import asyncio
+from typing import Callable, Dict
+
+import httpx
+
+from app.providers.alwaseet import ALWASEET_BASE_URL, AlwaseetProvider
+
+
+def fake_alwaseet_transport(
+    latency: float = 0.0,
+    cities: int = 18,
+    regions_per_city: int = 200,
+    password: str = "secret",
+) -> httpx.MockTransport:
+    """Mock Alwaseet merchant API answering with the status/data/msg envelope"""
+    city_rows = [{"id": str(i), "city_name": f"City {i}"} for i in range(1, cities + 1)]
+    sizes = [{"id": "1", "size": "عادي"}, {"id": "2", "size": "كبير"}]
+    orders = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if latency:
+            await asyncio.sleep(latency)
+        path = request.url.path.rsplit("/", 1)[-1]
+
+        if path == "login":
+            form = dict(httpx.QueryParams(request.content.decode()))
+            if form.get("password") != password:
+                return httpx.Response(200, json={"status": False, "msg": "invalid credentials"})
+            return httpx.Response(200, json={"status": True, "data": {"token": f"tok-{form['username']}"}})
+
+        if not request.url.params.get("token", "").startswith("tok-"):
+            return httpx.Response(200, json={"status": False, "msg": "invalid token"})
+
+        if path == "citys":
+            return httpx.Response(200, json={"status": True, "data": city_rows})
+        if path == "regions":
+            city_id = request.url.params["city_id"]
+            regions = [
+                {"id": f"{city_id}{i:04d}", "region_name": f"Region {i}"}
+                for i in range(regions_per_city)
+            ]
+            return httpx.Response(200, json={"status": True, "data": regions})
+        if path == "package-sizes":
+            return httpx.Response(200, json={"status": True, "data": sizes})
+        if path == "create-order":
+            orders.append(dict(httpx.QueryParams(request.content.decode())))
+            return httpx.Response(200, json={"status": True, "data": [{"qr_id": str(len(orders))}]})
+        return httpx.Response(404, json={"status": False, "msg": "not found"})
+
+    transport = httpx.MockTransport(handler)
+    transport.orders = orders
+    return transport
+
+
+# Provider name -> factory building the adapter against its local fake
+FAKE_PROVIDERS: Dict[str, Callable[..., AlwaseetProvider]] = {
+    "alwaseet": lambda **kwargs: AlwaseetProvider(
+        base_url=ALWASEET_BASE_URL, transport=fake_alwaseet_transport(**kwargs)
+    ),
+}
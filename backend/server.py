@@ -9,7 +9,10 @@ from pydantic import BaseModel, Field
 from typing import List
 import uuid
 from datetime import datetime
-from app.api.alwaseet import router as alwaseet_router
+from app.api.delivery import router as delivery_router, session_store
+from app.core.lifecycle import DEFAULT_DRAIN_TIMEOUT, DrainMiddleware, ResourceManager, every, serve
+from app.core.sessions import MongoSessionBackend
+from app.providers.registry import registry as provider_registry
 
 
 ROOT_DIR = Path(__file__).parent
@@ -20,8 +23,28 @@ mongo_url = os.environ['MONGO_URL']
 client = AsyncIOMotorClient(mongo_url)
 db = client[os.environ['DB_NAME']]
 
+# Share merchant sessions between workers through MongoDB when enabled
+shared_sessions = os.environ.get('DELIVERY_SESSION_STORE') == 'mongo'
+if shared_sessions:
+    session_store.shared = MongoSessionBackend(db.delivery_sessions)
+
+# Long-lived resources; closers run in reverse order at shutdown
+resources = ResourceManager(
+    drain_timeout=float(os.environ.get('SHUTDOWN_DRAIN_TIMEOUT', DEFAULT_DRAIN_TIMEOUT))
+)
+resources.add_closer("mongo", client.close)
+resources.add_closer("delivery providers", provider_registry.aclose)
+resources.add_warmup("mongo", lambda: client.admin.command("ping"))
+if shared_sessions:
+    resources.add_warmup(
+        "delivery session index",
+        lambda: db.delivery_sessions.create_index("expires_on", expireAfterSeconds=0)
+    )
+resources.add_background("session sweeper", every(300, session_store.sweep))
+resources.add_background("provider cache sweeper", every(60, provider_registry.sweep))
+
 # Create the main app without a prefix
-app = FastAPI()
+app = FastAPI(lifespan=resources.lifespan)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -55,7 +78,10 @@ async def get_status_checks():
 
 # Include routers in the main app
 app.include_router(api_router)
-app.include_router(alwaseet_router)
+app.include_router(delivery_router)
+
+# Refuse new requests and wait for in-flight ones during shutdown
+app.add_middleware(DrainMiddleware, manager=resources)
 
 app.add_middleware(
     CORSMiddleware,
@@ -72,6 +98,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@app.on_event("shutdown")
-async def shutdown_db_client():
-    client.close()
+
+if __name__ == "__main__":
+    # Start with `python server.py` so SIGTERM begins the drain immediately;
+    # under the plain uvicorn CLI pass --timeout-graceful-shutdown instead
+    serve(
+        app,
+        resources,
+        host=os.environ.get('HOST', '0.0.0.0'),
+        port=int(os.environ.get('PORT', 8001)),
+    )
@@ -10,10 +10,13 @@ import {
   ActivityIndicator,
 } from 'react-native';
 import { Ionicons } from '@expo/vector-icons';
-import Constants from 'expo-constants';
 import { theme } from '../config/theme';
 import { useCities, City } from '../hooks/useCities';
-import { useDeliveryCompany } from '../hooks/useDeliveryCompany';
+import {
+  useDeliveryCompany,
+  deliveryApiUrl,
+  getDeliverySession,
+} from '../hooks/useDeliveryCompany';
 import { IraqiPhoneInput } from './IraqiPhoneInput';
 
 interface Region {
@@ -87,17 +90,19 @@ export const ShippingForm: React.FC<ShippingFormProps> = ({ onShippingChange })
       setRegionsLoading(true);
       console.log('🌍 Fetching regions for city:', cityId);
       
-      const backendUrl = Constants.expoConfig?.extra?.EXPO_PUBLIC_BACKEND_URL || '';
-      const response = await fetch(
-        `${backendUrl}/api/alwaseet/regions?city_id=${cityId}`,
-        {
-          headers: {
-            'X-Alwaseet-Username': company.credentials.username,
-            'X-Alwaseet-Password': company.credentials.password,
-          },
-        }
-      );
-      
+      const requestRegions = async (sessionId: string) =>
+        fetch(`${deliveryApiUrl(company)}/regions?city_id=${cityId}`, {
+          headers: { 'X-Delivery-Session': sessionId },
+        });
+
+      const sessionId = await getDeliverySession(company);
+      let response = await requestRegions(sessionId);
+
+      // Session expired or was revoked on the server: log in again once and retry
+      if (response.status === 401) {
+        response = await requestRegions(await getDeliverySession(company, sessionId));
+      }
+
       const data = await response.json();
       
       if (data.success && data.regions) {
@@ -1,5 +1,6 @@
 import { useState, useEffect } from 'react';
 import { doc, getDoc } from 'firebase/firestore';
+import Constants from 'expo-constants';
 import { db } from '../config/firebase';
 
 export interface DeliveryCompany {
@@ -11,8 +12,102 @@ export interface DeliveryCompany {
   isActive: boolean;
   isDefault: boolean;
   name: string;
+  provider?: string; // Backend adapter name, defaults to 'alwaseet'
 }
 
+// One backend delivery session per company login, shared by every screen and
+// reused across mounts; it is revoked when the company or its credentials change
+interface CachedSession {
+  key: string;
+  sessionUrl: string;
+  sessionId: Promise<string>;
+  resolvedId?: string;
+}
+
+let cachedSession: CachedSession | null = null;
+
+export const deliveryApiUrl = (company: DeliveryCompany) => {
+  const backendUrl = Constants.expoConfig?.extra?.EXPO_PUBLIC_BACKEND_URL || '';
+  return `${backendUrl}/api/${company.provider ?? 'alwaseet'}`;
+};
+
+const sessionKey = (company: DeliveryCompany) =>
+  JSON.stringify([
+    deliveryApiUrl(company),
+    company.credentials.username,
+    company.credentials.password,
+  ]);
+
+const revokeSession = (session: CachedSession) => {
+  session.sessionId
+    .then((sessionId) =>
+      fetch(session.sessionUrl, {
+        method: 'DELETE',
+        headers: { 'X-Delivery-Session': sessionId },
+      })
+    )
+    .catch((err) => console.log('⚠️ Could not revoke delivery session:', err));
+};
+
+const openSession = async (sessionUrl: string, company: DeliveryCompany): Promise<string> => {
+  const response = await fetch(sessionUrl, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({
+      username: company.credentials.username,
+      password: company.credentials.password,
+    }),
+  });
+  const data = await response.json();
+
+  if (!data.success || !data.session_id) {
+    throw new Error(data.detail || 'Failed to open delivery session');
+  }
+  return data.session_id;
+};
+
+// Revoke the cached session if it belongs to other credentials than `company`
+const releaseStaleSession = (company: DeliveryCompany | null) => {
+  if (cachedSession && (!company || cachedSession.key !== sessionKey(company))) {
+    revokeSession(cachedSession);
+    cachedSession = null;
+  }
+};
+
+/**
+ * Session ID for the company's delivery API, logging in only when no session
+ * is cached. Pass the ID the server rejected (401) to replace it.
+ */
+export const getDeliverySession = (
+  company: DeliveryCompany,
+  expiredSessionId?: string
+): Promise<string> => {
+  releaseStaleSession(company);
+
+  const current = cachedSession;
+  if (current && (expiredSessionId === undefined || current.resolvedId !== expiredSessionId)) {
+    return current.sessionId;
+  }
+
+  const sessionUrl = `${deliveryApiUrl(company)}/session`;
+  const session: CachedSession = {
+    key: sessionKey(company),
+    sessionUrl,
+    sessionId: openSession(sessionUrl, company),
+  };
+  cachedSession = session;
+  session.sessionId.then(
+    (sessionId) => {
+      session.resolvedId = sessionId;
+    },
+    () => {
+      // Don't cache a failed login
+      if (cachedSession === session) cachedSession = null;
+    }
+  );
+  return session.sessionId;
+};
+
 export const useDeliveryCompany = () => {
   const [company, setCompany] = useState<DeliveryCompany | null>(null);
   const [loading, setLoading] = useState(true);
@@ -34,6 +129,7 @@ export const useDeliveryCompany = () => {
       if (docSnap.exists()) {
         const data = docSnap.data() as DeliveryCompany;
         console.log('✅ Delivery company loaded:', data.name);
+        releaseStaleSession(data);
         setCompany(data);
       } else {
         console.log('❌ Delivery company not found');
@@ -0,0 +1,75 @@
+import asyncio
+import gc
+import json
+
+from app.providers.compact import CompactPool, CompactTable
+from app.providers.managed import ManagedProvider
+from benchmarks.fakes import FAKE_PROVIDERS
+
+
+REGIONS = [
+    {"id": "101", "region_name": "الكرادة"},
+    {"id": "102", "region_name": "المنصور", "note": {"zone": 2, "pct": "5%"}},
+    {"id": 103, "region_name": None},
+]
+
+
+def dumps(value):
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def test_compact_table_round_trips_and_encodes_like_json():
+    pool = CompactPool()
+    table = pool.intern(REGIONS)
+
+    assert isinstance(table, CompactTable)
+    assert len(table) == 3
+    assert table == REGIONS
+    assert table[-1] == REGIONS[-1]
+    assert table[1:] == REGIONS[1:]
+    assert table.to_json() == dumps(REGIONS)
+
+    uniform = pool.intern([{"id": "1", "size%": "عادي"}, {"id": "2", "size%": "كبير"}])
+    assert json.loads(uniform.to_json()) == [{"id": "1", "size%": "عادي"}, {"id": "2", "size%": "كبير"}]
+    assert pool.intern([]).to_json() == b"[]"
+
+
+def test_identical_payloads_share_one_table():
+    pool = CompactPool()
+    first = pool.intern(json.loads(json.dumps(REGIONS)))
+    second = pool.intern(json.loads(json.dumps(REGIONS)))
+    other = pool.intern(REGIONS[:1])
+
+    assert first is second
+    assert other is not first
+    assert len(pool) == 2
+
+    del first, second
+    gc.collect()
+    assert len(pool) == 1
+
+
+def test_non_tabular_payloads_pass_through():
+    pool = CompactPool()
+    payload = {"token": "abc"}
+    assert pool.intern(payload) is payload
+    assert pool.intern(["a", "b"]) == ["a", "b"]
+    assert len(pool) == 0
+
+
+def test_merchants_share_cached_regions():
+    async def scenario():
+        pool = CompactPool()
+        provider = ManagedProvider(FAKE_PROVIDERS["alwaseet"](regions_per_city=50), pool=pool)
+        tokens = [await provider.login(f"merchant{i}", "secret") for i in range(10)]
+
+        tables = [await provider.get_regions(token, 3) for token in tokens]
+        cities = [await provider.get_cities(token) for token in tokens]
+        await provider.aclose()
+        return pool, tables, cities
+
+    pool, tables, cities = asyncio.run(scenario())
+    assert all(table is tables[0] for table in tables)
+    assert all(c is cities[0] for c in cities)
+    assert len(pool) == 2
+    assert tables[0][0] == {"id": "30000", "region_name": "Region 0"}
@@ -0,0 +1,228 @@
+import asyncio
+import gc
+
+import httpx
+import pytest
+
+from app.providers.alwaseet import AlwaseetProvider
+from app.providers.base import (
+    DeliveryProvider,
+    OrderCreate,
+    ProviderAuthError,
+    ProviderError,
+    ProviderUnavailable,
+)
+from app.providers.compact import CompactPool
+from app.providers.managed import ManagedProvider
+from app.providers.registry import ProviderRegistry, registry
+from benchmarks.fakes import fake_alwaseet_transport
+
+
+ORDER = OrderCreate(
+    customer_name="Ali",
+    phone1="+9647700000000",
+    city_id="1",
+    region_id="10001",
+    address="Near the market",
+    package_size="1",
+    type_name="Shoes",
+    price=25000,
+)
+
+
+class FlakyProvider(DeliveryProvider):
+    name = "flaky"
+
+    def __init__(self, failures=0, delay=0.0):
+        self.failures = failures
+        self.delay = delay
+        self.calls = 0
+
+    async def _maybe_fail(self):
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.failures:
+            self.failures -= 1
+            raise ProviderUnavailable("Error fetching cities: boom")
+
+    async def login(self, username, password):
+        return "token"
+
+    async def get_cities(self, token):
+        await self._maybe_fail()
+        return [{"id": "1"}]
+
+    async def get_regions(self, token, city_id):
+        await self._maybe_fail()
+        return [{"id": str(city_id)}]
+
+    async def get_package_sizes(self, token):
+        return []
+
+    async def create_order(self, token, order):
+        await self._maybe_fail()
+        return {"qr_id": "1"}
+
+
+def test_alwaseet_adapter_unwraps_envelope():
+    async def scenario():
+        transport = fake_alwaseet_transport(regions_per_city=3)
+        provider = AlwaseetProvider(transport=transport)
+        token = await provider.login("shop", "secret")
+        assert token == "tok-shop"
+        assert len(await provider.get_cities(token)) == 18
+        assert [r["region_name"] for r in await provider.get_regions(token, 5)] == [
+            "Region 0", "Region 1", "Region 2"
+        ]
+        assert await provider.create_order(token, ORDER) == {"qr_id": "1"}
+        assert transport.orders[0]["client_name"] == "Ali"
+        assert transport.orders[0]["location"] == "Near the market"
+
+        with pytest.raises(ProviderAuthError):
+            await provider.login("shop", "wrong")
+        with pytest.raises(ProviderError) as error:
+            await provider.get_cities("bad")
+        assert error.value.detail == "invalid token"
+        assert not error.value.retryable
+        await provider.aclose()
+
+        for body in ([], "ok", None):
+            odd = AlwaseetProvider(transport=httpx.MockTransport(
+                lambda request, body=body: httpx.Response(200, json=body)
+            ))
+            with pytest.raises(ProviderUnavailable):
+                await odd.get_cities("tok-shop")
+            await odd.aclose()
+
+        no_order = AlwaseetProvider(transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, json={"status": True, "data": []})
+        ))
+        with pytest.raises(ProviderUnavailable):
+            await no_order.create_order("tok-shop", ORDER)
+        await no_order.aclose()
+
+    asyncio.run(scenario())
+
+
+def test_reads_are_cached_and_concurrent_misses_coalesced():
+    async def scenario():
+        flaky = FlakyProvider(delay=0.01)
+        provider = ManagedProvider(flaky)
+        results = await asyncio.gather(*(provider.get_regions("t", 7) for _ in range(20)))
+        assert all(r == [{"id": "7"}] for r in results)
+        await provider.get_regions("t", 7)
+        assert flaky.calls == 1
+        regions = provider.metrics()["operations"]["regions"]
+        assert regions["coalesced"] == 19
+        assert regions["cache_hits"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_caller_does_not_cancel_coalesced_waiters():
+    async def scenario():
+        flaky = FlakyProvider(delay=0.05)
+        provider = ManagedProvider(flaky)
+        leader = asyncio.create_task(provider.get_regions("t", 7))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(provider.get_regions("t", 7)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+
+        leader.cancel()
+        results = await asyncio.gather(*waiters)
+        assert all(r == [{"id": "7"}] for r in results)
+        assert leader.cancelled()
+        assert flaky.calls == 1
+
+    asyncio.run(scenario())
+
+
+def test_expired_entries_are_dropped_and_cache_is_bounded():
+    async def scenario():
+        now = [0.0]
+        pool = CompactPool()
+        provider = ManagedProvider(
+            FlakyProvider(), cache_ttl=10, max_entries=50, clock=lambda: now[0], pool=pool
+        )
+        for token in range(100):
+            await provider.get_regions(f"token{token}", token)
+        assert provider.metrics()["cache_entries"] == 50
+        assert len(pool) >= 50
+
+        now[0] = 11
+        assert provider.sweep() == 50
+        assert provider.metrics()["cache_entries"] == 0
+        # Let the loop drop its wakeup handle for the last awaited result
+        await asyncio.sleep(0)
+        gc.collect()
+        # Nothing holds the tables once their cache entries are gone
+        assert len(pool) == 0
+
+        await provider.get_regions("fresh", 2)
+        now[0] = 30
+        await provider.get_regions("fresh", 3)
+        await provider.get_regions("fresh", 2)
+        assert provider.metrics()["cache_entries"] == 2
+
+    asyncio.run(scenario())
+
+
+def test_reads_retry_but_orders_do_not():
+    async def scenario():
+        flaky = FlakyProvider(failures=2)
+        provider = ManagedProvider(flaky, backoff=0)
+        assert await provider.get_cities("t") == [{"id": "1"}]
+        assert flaky.calls == 3
+
+        flaky.failures = 1
+        with pytest.raises(ProviderUnavailable):
+            await provider.create_order("t", ORDER)
+        assert flaky.calls == 4
+        assert provider.metrics()["operations"]["cities"]["retries"] == 2
+
+    asyncio.run(scenario())
+
+
+def test_circuit_opens_after_repeated_failures():
+    async def scenario():
+        now = [0.0]
+        flaky = FlakyProvider(failures=100)
+        provider = ManagedProvider(
+            flaky, retries=0, failure_threshold=3, reset_after=10, clock=lambda: now[0]
+        )
+        for _ in range(3):
+            with pytest.raises(ProviderUnavailable):
+                await provider.get_regions("t", 1)
+        with pytest.raises(ProviderUnavailable) as error:
+            await provider.get_regions("t", 1)
+        assert error.value.status_code == 503
+        assert flaky.calls == 3
+
+        now[0] = 11
+        flaky.failures = 0
+        assert await provider.get_regions("t", 1) == [{"id": "1"}]
+
+    asyncio.run(scenario())
+
+
+def test_registry_builds_providers_lazily():
+    test_registry = ProviderRegistry()
+    built = []
+    test_registry.register("flaky", lambda: built.append(1) or FlakyProvider(), cache_ttl=0)
+
+    assert built == []
+    provider = test_registry.get("flaky")
+    assert test_registry.get("flaky") is provider
+    assert provider.cache_ttl == 0
+    assert built == [1]
+    with pytest.raises(KeyError):
+        test_registry.get("missing")
+    assert "alwaseet" in registry.names()
+
+    # Replacing a built adapter would leak its client, so it is refused
+    test_registry.register("idle", FlakyProvider)
+    test_registry.register("idle", FlakyProvider, retries=0)
+    with pytest.raises(ValueError):
+        test_registry.register("flaky", FlakyProvider)
+    assert test_registry.get("flaky") is provider
@@ -0,0 +1,249 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import delivery
+from app.core.sessions import MongoSessionBackend, SessionStore
+from app.providers.base import DeliveryProvider, ProviderAuthError
+from app.providers.registry import ProviderRegistry
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeSharedBackend:
+    def __init__(self):
+        self.records = {}
+        self.loads = 0
+
+    async def load(self, session_id):
+        self.loads += 1
+        return self.records.get(session_id)
+
+    async def save(self, session_id, record):
+        self.records[session_id] = dict(record)
+
+    async def delete(self, session_id):
+        self.records.pop(session_id, None)
+
+
+class FakeCollection:
+    """Just the Motor collection calls MongoSessionBackend makes"""
+
+    def __init__(self):
+        self.documents = {}
+
+    async def find_one(self, query):
+        return self.documents.get(query["_id"])
+
+    async def replace_one(self, query, document, upsert=False):
+        self.documents[query["_id"]] = dict(document)
+
+    async def delete_one(self, query):
+        self.documents.pop(query["_id"], None)
+
+
+class FakeProvider(DeliveryProvider):
+    name = "fake"
+
+    def __init__(self):
+        self.logins = []
+
+    async def login(self, username, password):
+        self.logins.append(username)
+        if password != "secret":
+            raise ProviderAuthError("Failed to authenticate with Fake")
+        return f"token-{username}"
+
+    async def get_cities(self, token):
+        return [{"id": token}]
+
+    async def get_regions(self, token, city_id):
+        return [{"id": token}]
+
+    async def get_package_sizes(self, token):
+        return []
+
+    async def create_order(self, token, order):
+        return {}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    fake = FakeProvider()
+    test_registry = ProviderRegistry()
+    test_registry.register("fake", lambda: fake, cache_ttl=0)
+    test_registry.register("other", FakeProvider)
+    monkeypatch.setattr(delivery, "registry", test_registry)
+    monkeypatch.setattr(delivery, "session_store", SessionStore(ttl_seconds=60))
+
+    app = FastAPI()
+    app.include_router(delivery.router)
+    test_client = TestClient(app)
+    test_client.logins = fake.logins
+    return test_client
+
+
+def test_session_is_created_once_and_reused(client):
+    response = client.post("/api/fake/session", json={"username": "shop", "password": "secret"})
+    assert response.status_code == 200
+    session_id = response.json()["session_id"]
+
+    headers = {"X-Delivery-Session": session_id}
+    for _ in range(3):
+        regions = client.get("/api/fake/regions", params={"city_id": 1}, headers=headers)
+        assert regions.json()["regions"] == [{"id": "token-shop"}]
+    assert client.get("/api/fake/cities", headers=headers).status_code == 200
+    assert client.logins == ["shop"]
+
+
+def test_wrong_password_does_not_reuse_cached_token(client):
+    assert client.post("/api/fake/session", json={"username": "shop", "password": "secret"}).status_code == 200
+
+    response = client.post("/api/fake/session", json={"username": "shop", "password": "guess"})
+    assert response.status_code == 401
+    assert client.logins == ["shop", "shop"]
+
+
+def test_unknown_and_revoked_sessions_are_rejected(client):
+    assert client.get("/api/fake/cities", headers={"X-Delivery-Session": "nope"}).status_code == 401
+    assert client.get("/api/fake/cities").status_code == 422
+
+    session_id = client.post(
+        "/api/fake/session", json={"username": "shop", "password": "secret"}
+    ).json()["session_id"]
+    headers = {"X-Delivery-Session": session_id}
+    assert client.delete("/api/fake/session", headers=headers).status_code == 200
+    assert client.get("/api/fake/cities", headers=headers).status_code == 401
+
+
+def test_session_is_bound_to_its_provider(client):
+    session_id = client.post(
+        "/api/fake/session", json={"username": "shop", "password": "secret"}
+    ).json()["session_id"]
+    headers = {"X-Delivery-Session": session_id}
+
+    assert client.get("/api/other/cities", headers=headers).status_code == 401
+    assert client.get("/api/missing/cities", headers=headers).status_code == 404
+
+
+def test_sessions_expire_after_ttl():
+    clock = FakeClock()
+    store = SessionStore(ttl_seconds=30, clock=clock)
+
+    async def scenario():
+        session = await store.create("fake", "shop", "token")
+        assert await store.resolve(session.session_id) is session
+        clock.now += 31
+        assert await store.resolve(session.session_id) is None
+        assert len(store) == 0
+
+    asyncio.run(scenario())
+
+
+def test_shared_backend_is_only_read_on_local_miss():
+    clock = FakeClock()
+    shared = FakeSharedBackend()
+    worker_a = SessionStore(ttl_seconds=300, shared=shared, clock=clock, recheck_interval=30)
+    worker_b = SessionStore(ttl_seconds=300, shared=shared, clock=clock, recheck_interval=30)
+
+    async def scenario():
+        session = await worker_a.create("fake", "shop", "token")
+        for _ in range(5):
+            assert (await worker_a.resolve(session.session_id)).token == "token"
+        assert shared.loads == 0
+
+        for _ in range(5):
+            assert (await worker_b.resolve(session.session_id)).username == "shop"
+        assert shared.loads == 1
+
+        clock.now += 31
+        assert (await worker_b.resolve(session.session_id)).username == "shop"
+        assert shared.loads == 2
+
+    asyncio.run(scenario())
+
+
+def test_revoke_on_one_worker_reaches_the_others():
+    clock = FakeClock()
+    shared = FakeSharedBackend()
+    worker_a = SessionStore(ttl_seconds=3600, shared=shared, clock=clock, recheck_interval=30)
+    worker_b = SessionStore(ttl_seconds=3600, shared=shared, clock=clock, recheck_interval=30)
+
+    async def scenario():
+        session = await worker_a.create("fake", "shop", "token")
+        assert await worker_b.resolve(session.session_id) is not None
+
+        await worker_a.revoke(session.session_id)
+        assert await worker_a.resolve(session.session_id) is None
+
+        # Worker B notices at its next re-check, long before the session TTL
+        clock.now += 31
+        assert await worker_b.resolve(session.session_id) is None
+        assert len(worker_b) == 0
+
+    asyncio.run(scenario())
+
+
+def test_mongo_backend_does_not_store_raw_session_ids():
+    collection = FakeCollection()
+    store = SessionStore(ttl_seconds=3600, shared=MongoSessionBackend(collection))
+    other_worker = SessionStore(ttl_seconds=3600, shared=MongoSessionBackend(collection))
+
+    async def scenario():
+        session = await store.create("fake", "shop", "token")
+        assert session.session_id not in collection.documents
+        assert len(collection.documents) == 1
+
+        assert (await other_worker.resolve(session.session_id)).token == "token"
+        await store.revoke(session.session_id)
+        assert collection.documents == {}
+
+    asyncio.run(scenario())
+
+
+def test_sweep_drops_expired_sessions():
+    clock = FakeClock()
+    store = SessionStore(ttl_seconds=10, clock=clock)
+
+    async def scenario():
+        for i in range(5):
+            await store.create("fake", f"shop{i}", "token")
+        clock.now += 11
+        await store.create("fake", "fresh", "token")
+        assert store.sweep() == 5
+        assert len(store) == 1
+
+    asyncio.run(scenario())
+
+
+def test_sessions_resolve_through_the_app_under_load(client):
+    """Many live sessions all resolve through the header dependency"""
+    store = delivery.session_store
+
+    async def create_sessions():
+        return [(await store.create("fake", f"shop{i}", f"token-shop{i}")).session_id
+                for i in range(5_000)]
+
+    ids = asyncio.run(create_sessions())
+    for i in range(0, len(ids), 250):
+        response = client.get("/api/fake/cities", headers={"X-Delivery-Session": ids[i]})
+        assert response.json()["cities"] == [{"id": f"token-shop{i}"}]
+    assert client.logins == []
+
+
+def test_metrics_require_the_admin_token(client, monkeypatch):
+    assert client.get("/api/fake/metrics").status_code == 403
+
+    monkeypatch.setattr(delivery, "METRICS_TOKEN", "ops-secret")
+    assert client.get("/api/fake/metrics", headers={"X-Admin-Token": "guess"}).status_code == 403
+    response = client.get("/api/fake/metrics", headers={"X-Admin-Token": "ops-secret"})
+    assert response.status_code == 200
+    assert response.json()["metrics"]["provider"] == "fake"
@@ -0,0 +1,183 @@
+import asyncio
+import signal
+import time
+
+import httpx
+from fastapi import FastAPI
+
+from app.core.lifecycle import DrainMiddleware, ResourceManager, build_server, every
+
+
+def build_app(manager, delay=0.05):
+    app = FastAPI(lifespan=manager.lifespan)
+    completed = []
+
+    @app.get("/slow")
+    async def slow():
+        await asyncio.sleep(delay)
+        completed.append(1)
+        return {"ok": True}
+
+    app.add_middleware(DrainMiddleware, manager=manager)
+    return app, completed
+
+
+def test_shutdown_drains_in_flight_requests_under_load():
+    async def scenario():
+        manager = ResourceManager(drain_timeout=5)
+        closed = []
+        manager.add_closer("mongo", lambda: closed.append("mongo"))
+        manager.add_closer("http pool", lambda: closed.append("http pool"))
+        app, completed = build_app(manager)
+        await manager.startup()
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            load = [asyncio.create_task(client.get("/slow")) for _ in range(50)]
+            while manager.in_flight < 50:
+                await asyncio.sleep(0)
+
+            report = await manager.shutdown()
+            late = await client.get("/slow")
+            responses = await asyncio.gather(*load)
+
+        assert report["drained"]
+        assert report["in_flight_at_drain"] == 50
+        assert report["abandoned"] == 0
+        assert 0 < report["drain_seconds"] < 1
+        assert all(r.status_code == 200 for r in responses)
+        assert len(completed) == 50
+        assert late.status_code == 503
+        # Closers run after the drain, most recently registered first
+        assert closed == ["http pool", "mongo"]
+
+    asyncio.run(scenario())
+
+
+def test_shutdown_gives_up_at_the_drain_deadline():
+    async def scenario():
+        manager = ResourceManager(drain_timeout=0.1)
+        closed = []
+        manager.add_closer("pool", lambda: closed.append("pool"))
+        await manager.startup()
+
+        async def stuck():
+            async with manager.track():
+                await asyncio.sleep(10)
+
+        task = asyncio.create_task(stuck())
+        await asyncio.sleep(0)
+        start = time.perf_counter()
+        report = await manager.shutdown()
+        elapsed = time.perf_counter() - start
+        task.cancel()
+
+        assert not report["drained"]
+        assert report["abandoned"] == 1
+        assert elapsed < 1
+        assert closed == ["pool"]
+
+    asyncio.run(scenario())
+
+
+def test_warmups_run_concurrently_and_failures_do_not_block_startup():
+    async def scenario():
+        manager = ResourceManager(warmup_timeout=1)
+
+        async def warm():
+            await asyncio.sleep(0.1)
+
+        async def broken():
+            raise RuntimeError("no mongo")
+
+        for i in range(5):
+            manager.add_warmup(f"cache {i}", warm)
+        manager.add_warmup("mongo", broken)
+
+        report = await manager.startup()
+        await manager.shutdown()
+
+        assert report["warmup_seconds"] < 0.3
+        assert report["warmups"]["cache 0"] == "ok"
+        assert report["warmups"]["mongo"].startswith("failed")
+
+    asyncio.run(scenario())
+
+
+def test_background_tasks_are_cancelled_on_shutdown():
+    async def scenario():
+        manager = ResourceManager()
+        ticks = []
+        manager.add_background("refresher", every(0.01, lambda: ticks.append(1)))
+        await manager.startup()
+        await asyncio.sleep(0.05)
+        await manager.shutdown()
+
+        seen = len(ticks)
+        await asyncio.sleep(0.05)
+        assert seen > 0
+        assert len(ticks) == seen
+
+    asyncio.run(scenario())
+
+
+async def start_uvicorn(app, manager):
+    server = build_server(app, manager, host="127.0.0.1", port=0, log_level="warning")
+    # Signals are simulated through handle_exit; keep the test runner's handlers
+    server.install_signal_handlers = lambda: None
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+    return server, task, f"http://127.0.0.1:{port}"
+
+
+def test_sigterm_under_uvicorn_drains_from_the_signal():
+    async def scenario():
+        manager = ResourceManager(drain_timeout=5)
+        app, completed = build_app(manager, delay=0.3)
+        server, task, url = await start_uvicorn(app, manager)
+
+        async with httpx.AsyncClient(base_url=url) as client:
+            load = [asyncio.create_task(client.get("/slow")) for _ in range(10)]
+            while manager.in_flight < 10:
+                await asyncio.sleep(0.01)
+
+            server.handle_exit(signal.SIGTERM, None)
+            assert not manager.accepting
+            responses = await asyncio.gather(*load)
+        await task
+        return manager.last_report, responses, completed
+
+    report, responses, completed = asyncio.run(scenario())
+    assert all(r.status_code == 200 for r in responses)
+    assert len(completed) == 10
+    assert report["drained"]
+    assert report["in_flight_at_drain"] == 10
+    # Measured from the signal, so it covers the requests uvicorn waited for
+    assert 0.15 < report["drain_seconds"] < 2
+
+
+def test_sigterm_under_uvicorn_cuts_off_requests_at_the_deadline():
+    async def scenario():
+        manager = ResourceManager(drain_timeout=0.3)
+        app, completed = build_app(manager, delay=30)
+        server, task, url = await start_uvicorn(app, manager)
+
+        async with httpx.AsyncClient(base_url=url) as client:
+            load = [asyncio.create_task(client.get("/slow")) for _ in range(5)]
+            while manager.in_flight < 5:
+                await asyncio.sleep(0.01)
+
+            start = time.perf_counter()
+            server.handle_exit(signal.SIGTERM, None)
+            await task
+            elapsed = time.perf_counter() - start
+            await asyncio.gather(*load, return_exceptions=True)
+        return manager.last_report, elapsed, completed
+
+    report, elapsed, completed = asyncio.run(scenario())
+    assert completed == []
+    assert not report["drained"]
+    assert report["abandoned"] == 5
+    assert elapsed < 2